@@ -1,19 +1,21 @@
 """Accessible imports for the holoviz_mcp package."""
 
-import importlib.metadata
-import warnings
-
-try:
-    __version__ = importlib.metadata.version(__name__)
-except importlib.metadata.PackageNotFoundError as e:  # pragma: no cover
-    warnings.warn(f"Could not determine version of {__name__}\n{e!s}", stacklevel=2)
-    __version__ = "unknown"
-
 __all__: list[str] = ["mcp", "main"]
 
 
 def __getattr__(name: str) -> object:
-    """Lazy imports for heavy server objects to keep CLI startup fast."""
+    """Lazy imports for heavy server objects and the version to keep CLI startup fast."""
+    if name == "__version__":
+        import importlib.metadata
+        import warnings
+
+        try:
+            version = importlib.metadata.version(__name__)
+        except importlib.metadata.PackageNotFoundError as e:  # pragma: no cover
+            warnings.warn(f"Could not determine version of {__name__}\n{e!s}", stacklevel=2)
+            version = "unknown"
+        globals()["__version__"] = version
+        return version
     if name in ("mcp", "main"):
         from holoviz_mcp.server import main as _main
         from holoviz_mcp.server import mcp as _mcp
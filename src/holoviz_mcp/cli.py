@@ -8,9 +8,7 @@ Infrastructure commands (serve, install, update) output human-readable text.
 """
 
 import asyncio
-import json
 import shutil
-import subprocess
 import sys
 from enum import Enum
 from typing import Optional
@@ -87,19 +85,14 @@ OutputFlag = Annotated[OutputFormat, typer.Option("--output", "-o", help="Output
 
 
 def _output_json(data: object) -> None:
-    """Output data as JSON. Handles Pydantic models and plain dicts/lists."""
-    if isinstance(data, list):
-        items = []
-        for item in data:
-            if hasattr(item, "model_dump"):
-                items.append(item.model_dump())
-            else:
-                items.append(item)
-        typer.echo(json.dumps(items, indent=2, default=str))
-    elif hasattr(data, "model_dump"):
-        typer.echo(json.dumps(data.model_dump(), indent=2, default=str))
-    else:
-        typer.echo(json.dumps(data, indent=2, default=str))
+    """Output data as JSON. Handles Pydantic models and plain dicts/lists.
+
+    Serialization is done by pydantic-core, so models are written directly
+    instead of being dumped to Python dicts first.
+    """
+    from pydantic_core import to_json
+
+    typer.echo(to_json(data, indent=2, fallback=str).decode())
 
 
 def _echo_output(text: str, output: OutputFormat) -> None:
@@ -347,7 +340,7 @@ def pn_params_cmd(
         raise typer.Exit(1) from None
 
     if output == OutputFormat.json:
-        _output_json({k: v.model_dump() for k, v in params.items()})
+        _output_json(params)
     else:
         lines: list[str] = [
             "| Parameter | Type | Default | Description |",
@@ -872,6 +865,8 @@ def install_claude(
 @install_app.command(name="chromium")
 def install_chromium() -> None:
     """Install Chromium for the inspect command (Playwright)."""
+    import subprocess
+
     subprocess.run([str(sys.executable), "-m", "playwright", "install", "chromium"], check=True)
 
 
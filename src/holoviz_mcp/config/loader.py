@@ -15,6 +15,9 @@ from .models import HoloVizMCPConfig
 
 logger = logging.getLogger(__name__)
 
+# The libyaml based loader is much faster, but is only available if PyYAML was built with libyaml
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigurationError(Exception):
     """Raised when configuration cannot be loaded or is invalid."""
@@ -102,7 +105,7 @@ class ConfigLoader:
         This prevents validation errors when loading user config files that might
         contain extra fields.
         """
-        known_fields = {"server", "docs", "resources", "prompts", "user_dir", "default_dir", "repos_dir"}
+        known_fields = {"server", "docs", "resources", "prompts", "panel", "user_dir", "default_dir", "repos_dir"}
         return {k: v for k, v in config_dict.items() if k in known_fields}
 
     def _get_default_config(self) -> dict[str, Any]:
@@ -141,7 +144,7 @@ class ConfigLoader:
         """
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                content = yaml.safe_load(f)
+                content = yaml.load(f, Loader=_YAML_LOADER)
                 if content is None:
                     return {}
                 if not isinstance(content, dict):
@@ -176,6 +176,20 @@ class DisplayConfig(BaseModel):
     )
 
 
+class PanelConfig(BaseModel):
+    """Configuration for the Panel component tools."""
+
+    discover_extensions: bool = Field(
+        default=True,
+        description="Discover Panel extensions by scanning the installed packages for dependents of Panel. Disable to only use Panel and 'extra_packages'.",
+    )
+    extra_packages: list[str] = Field(default_factory=list, description="Additional packages to import components from, e.g. 'panel_material_ui'.")
+    cache: bool = Field(
+        default=True,
+        description="Cache the discovered components on disk in the 'cache' folder of the user directory. Disable while developing Panel or an extension.",
+    )
+
+
 class HoloVizMCPConfig(BaseModel):
     """Main configuration for HoloViz MCP server."""
 
@@ -184,6 +198,7 @@ class HoloVizMCPConfig(BaseModel):
     resources: ResourceConfig = Field(default_factory=ResourceConfig)
     prompts: PromptConfig = Field(default_factory=PromptConfig)
     display: DisplayConfig = Field(default_factory=DisplayConfig)
+    panel: PanelConfig = Field(default_factory=PanelConfig)
 
     # Environment paths - merged from EnvironmentConfig with defaults
     user_dir: Path = Field(default_factory=_holoviz_mcp_user_dir, description="User configuration directory")
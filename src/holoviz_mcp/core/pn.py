@@ -14,7 +14,23 @@ Usage::
 
 from __future__ import annotations
 
+import difflib
+import hashlib
+import heapq
+import importlib
+import json
 import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -30,12 +46,154 @@ _DIST_TO_IMPORT: dict[str, str] = {
     "panel_graphic_walker": "panel_gwalker",
 }
 
-_COMPONENTS: list[ComponentDetails] = []
+# The project name at the start of a PEP 508 requirement, e.g. 'panel' in 'panel>=1.0; extra == "ui"'
+_REQUIREMENT_NAME_RE = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9_.\-]*)")
 
+# The module collecting the component summaries and docstrings, part of the components cache key
+_COLLECTION_MODULE_PATH = Path(__file__).resolve().parent.parent / "panel_mcp" / "data.py"
 
+# Bump when the collected summaries or docstrings change, so that existing cache files are ignored
+_COMPONENTS_CACHE_VERSION = 2
+
+# Component data by position. The lookup indexes store positions into these lists.
+_SUMMARIES: list[ComponentSummary] = []
+_SEARCH_KEYS: list[tuple[str, str, str]] = []  # lowercased (name, module_path, docstring)
+_COMPONENT_CLASSES: dict[int, type] = {}  # classes imported so far, by position
+_DETAILS: dict[int, ComponentDetails] = {}  # details collected so far, by position
+_BY_NAME_LOWER: dict[str, list[int]] = {}
+_BY_PACKAGE_LOWER: dict[str, list[int]] = {}
+_BY_PACKAGE_AND_NAME_LOWER: dict[tuple[str, str], list[int]] = {}
+_MODULE_PATHS: list[tuple[str, int]] = []  # sorted, for bisect-based prefix lookups
+_PACKAGES: tuple[str, ...] = ()  # sorted package names
+
+# Ensures the components are only loaded once when first requested from several threads
+_LOAD_LOCK = threading.Lock()
+
+
+def _dependents_cache_path() -> Path:
+    """Return the path of the file caching dependent packages across processes."""
+    from holoviz_mcp.config.loader import get_config
+
+    return get_config().user_dir / "cache" / "packages_depending_on.json"
+
+
+def _components_cache_path() -> Path:
+    """Return the path of the file caching the component summaries across processes."""
+    from holoviz_mcp.config.loader import get_config
+
+    return get_config().user_dir / "cache" / "components.json"
+
+
+def _environment_fingerprint() -> str:
+    """Return a hash identifying the installed distributions.
+
+    Only directory listings of the ``sys.path`` entries are needed, so this is much
+    cheaper than reading the metadata of every distribution. The paths themselves are
+    not hashed, so processes that only differ in e.g. ``sys.path[0]`` share the cache.
+    """
+    distributions = set()
+    for path in sys.path:
+        try:
+            entries = list(os.scandir(path or "."))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.endswith((".dist-info", ".egg-info")):
+                try:
+                    mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    # E.g. a dangling symlink or a distribution uninstalled during the scan
+                    continue
+                distributions.add(f"{entry.name}:{mtime_ns}")
+    return hashlib.sha256("\n".join(sorted(distributions)).encode()).hexdigest()
+
+
+def _components_fingerprint() -> str:
+    """Return a hash identifying the installed distributions, the collection code and the Panel configuration.
+
+    The source of the module collecting the components is included, so that editing it
+    in an editable install invalidates the cache even though no dist-info changes.
+    """
+    import holoviz_mcp
+    from holoviz_mcp.config.loader import get_config
+
+    digest = hashlib.sha256(_environment_fingerprint().encode())
+    digest.update(str(holoviz_mcp.__version__).encode())
+    try:
+        digest.update(_COLLECTION_MODULE_PATH.read_bytes())
+    except OSError:
+        pass
+    digest.update(get_config().panel.model_dump_json().encode())
+    return digest.hexdigest()
+
+
+def _source_directories(classes: list[type]) -> list[str]:
+    """Return the directories of the modules defining the classes and of their parent packages.
+
+    The sources of an editable install can change without changing any dist-info, so the
+    directories are stored with the cached components and checked when loading them.
+    """
+    directories = set()
+    for module_name in {cls.__module__ for cls in classes}:
+        module_file = getattr(sys.modules.get(module_name), "__file__", None)
+        if not module_file:
+            continue
+        directory = Path(module_file).parent
+        top_level_file = getattr(sys.modules.get(module_name.partition(".")[0]), "__file__", None)
+        root = Path(top_level_file).parent if top_level_file else directory
+        directories.add(str(directory))
+        while root in directory.parents:
+            directory = directory.parent
+            directories.add(str(directory))
+    return sorted(directories)
+
+
+def _sources_fingerprint(directories: list[str]) -> str:
+    """Return a hash of the Python sources and subdirectories in the given directories.
+
+    Editing, adding or removing a module, or adding a subpackage, changes the hash.
+    """
+    digest = hashlib.sha256()
+    for directory in directories:
+        digest.update(directory.encode())
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.name.endswith(".py"):
+                    stat = entry.stat()
+                    digest.update(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+                elif entry.name != "__pycache__" and entry.is_dir():
+                    digest.update(entry.name.encode())
+            except OSError:
+                # E.g. a dangling symlink or a file removed during the scan
+                continue
+    return digest.hexdigest()
+
+
+def _write_json(path: Path, data: object, indent: int | None = None) -> None:
+    """Write JSON to a temporary file and move it into place, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+@lru_cache(maxsize=None)
 def _list_packages_depending_on(target_package: str) -> list[str]:
     """Find all installed packages that depend on a given package.
 
+    The result is cached in memory and, unless ``panel.cache`` is disabled, on disk.
+    The disk cache is reused across processes for as long as the installed
+    distributions are unchanged.
+
     Parameters
     ----------
     target_package : str
@@ -44,54 +202,343 @@ def _list_packages_depending_on(target_package: str) -> list[str]:
     Returns
     -------
     list[str]
-        Sorted list of dependent package names.
+        Sorted list of dependent package names. Do not mutate, the list is cached.
     """
-    from importlib.metadata import distributions
+    from holoviz_mcp.config.loader import get_config
+
+    if not get_config().panel.cache:
+        return _scan_packages_depending_on(target_package)
+
+    fingerprint = _environment_fingerprint()
+    path = _dependents_cache_path()
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        data = None
+
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint or not isinstance(data.get("packages"), dict):
+        data = {"fingerprint": fingerprint, "packages": {}}
+    elif target_package in data["packages"]:
+        return data["packages"][target_package]
+    dependent_packages = _scan_packages_depending_on(target_package)
+    data["packages"][target_package] = dependent_packages
+    try:
+        _write_json(path, data, indent=2)
+    except OSError as e:
+        logger.warning("Failed to save dependent packages cache %s: %s", path, e)
+    return dependent_packages
+
+
+def _scan_packages_depending_on(target_package: str) -> list[str]:
+    """Scan the metadata of all installed distributions for dependents of a package.
 
-    dependent_packages = []
+    Parameters
+    ----------
+    target_package : str
+        The package name to search for (e.g., 'panel').
 
-    for dist in distributions():
-        if dist.requires:
-            dist_name = dist.metadata["Name"]
-            logger.debug("Checking package: %s for dependencies on %s", dist_name, target_package)
-            for requirement_str in dist.requires:
-                if "extra ==" in requirement_str:
+    Returns
+    -------
+    list[str]
+        Sorted list of dependent package names.
+    """
+    from packaging.requirements import InvalidRequirement
+    from packaging.requirements import Requirement
+    from packaging.utils import canonicalize_name
+
+    # Names are equal under any mix of case and '-', '_' and '.' separators (PEP 503)
+    target_name = canonicalize_name(target_package)
+    target_pattern = re.compile("[-_.]+".join(re.escape(part) for part in target_name.split("-")), re.IGNORECASE)
+    dependent_packages: set[str] = set()
+
+    checked_count = 0
+    for dist_name, requires in _iter_distribution_requirements():
+        checked_count += 1
+        for requirement_str in requires:
+            # Match the name first so that only requirements of the target package are parsed
+            match = _REQUIREMENT_NAME_RE.match(requirement_str)
+            if not match or not target_pattern.fullmatch(match.group(1)):
+                continue
+            try:
+                requirement = Requirement(requirement_str)
+            except InvalidRequirement:
+                continue
+            # Skip optional (extra) and environment specific requirements that are not active
+            if requirement.marker and not requirement.marker.evaluate({"extra": ""}):
+                continue
+            import_name = dist_name.replace("-", "_")
+            import_name = _DIST_TO_IMPORT.get(import_name, import_name)
+            dependent_packages.add(import_name)
+            break
+
+    logger.debug("Scanned %d distributions, found %d dependents of %s", checked_count, len(dependent_packages), target_package)
+    return sorted(dependent_packages)
+
+
+def _iter_distribution_requirements() -> Iterator[tuple[str, list[str]]]:
+    """Yield the name and requirements of each distribution installed on ``sys.path``.
+
+    The headers of the ``.dist-info/METADATA`` files are read directly, which is much
+    faster than parsing the full metadata with ``importlib.metadata.distributions()``.
+    Legacy ``.egg-info`` distributions are still read with ``importlib.metadata``.
+    """
+    from importlib.metadata import Distribution
+
+    for path in sys.path:
+        try:
+            entries = list(os.scandir(path or "."))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(".dist-info"):
+                try:
+                    name, requires = _read_metadata_headers(os.path.join(entry.path, "METADATA"))
+                except (OSError, UnicodeDecodeError):
                     continue
-                package_name = requirement_str.split()[0].split(";")[0].split(">=")[0].split("==")[0].split("!=")[0].split("<")[0].split(">")[0].split("~")[0]
-                if package_name.lower() == target_package.lower():
-                    import_name = dist_name.replace("-", "_")
-                    import_name = _DIST_TO_IMPORT.get(import_name, import_name)
-                    dependent_packages.append(import_name)
-                    break
+            elif entry.name.endswith(".egg-info"):
+                dist = Distribution.at(entry.path)
+                name, requires = dist.metadata["Name"], dist.requires or []
+            else:
+                continue
+            if name:
+                yield name, requires
+
 
-    return sorted(set(dependent_packages))
+def _read_metadata_headers(path: str) -> tuple[str, list[str]]:
+    """Read the ``Name`` and ``Requires-Dist`` headers of a core metadata file.
 
+    Parameters
+    ----------
+    path : str
+        Path of the ``METADATA`` file.
 
-def _get_all_components() -> list[ComponentDetails]:
-    """Get all available Panel components, with lazy initialization and caching.
+    Returns
+    -------
+    tuple[str, list[str]]
+        The distribution name and its requirement strings.
+    """
+    name = ""
+    requires = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            # The headers end at the first empty line, the description follows. Lines of folded
+            # (multi-line) header values start with whitespace and are skipped by the key checks.
+            if not line.rstrip("\r\n"):
+                break
+            key, _, value = line.partition(":")
+            if key == "Requires-Dist":
+                requires.append(value.strip())
+            elif key == "Name":
+                name = value.strip()
+    return name, requires
+
+
+def _get_all_components() -> list[ComponentSummary]:
+    """Get summaries of all available Panel components, with lazy initialization and caching.
+
+    Unless ``panel.cache`` is disabled, the summaries and docstrings are cached on disk and
+    reused across processes for as long as the installed distributions and the sources of
+    the components are unchanged. Then Panel and its extensions are only imported once the
+    details of a component are requested.
 
     Returns
     -------
-    list[ComponentDetails]
-        Complete list of all discovered Panel components.
+    list[ComponentSummary]
+        Complete list of all discovered Panel components. Use _get_component_details
+        to get the full details of a component by its position in this list.
     """
-    from holoviz_mcp.panel_mcp.data import get_components as _get_components_raw
+    if _SUMMARIES:
+        return _SUMMARIES
+
+    with _LOAD_LOCK:
+        if not _SUMMARIES:
+            from holoviz_mcp.config.loader import get_config
+
+            fingerprint = _components_fingerprint() if get_config().panel.cache else None
+            cached = _load_cached_components(fingerprint) if fingerprint else None
+            if cached is not None:
+                _build_indexes(*cached)
+            else:
+                from holoviz_mcp.panel_mcp.data import collect_component_summary
+                from holoviz_mcp.panel_mcp.data import get_docstring
+
+                classes = _discover_component_classes()
+                summaries = [collect_component_summary(cls) for cls in classes]
+                docstrings = [get_docstring(cls) for cls in classes]
+                _build_indexes(summaries, docstrings)
+                _COMPONENT_CLASSES.update(enumerate(classes))
+                if fingerprint:
+                    _save_cached_components(fingerprint, summaries, docstrings, _source_directories(classes))
+
+    return _SUMMARIES
+
+
+def _load_cached_components(fingerprint: str) -> tuple[list[ComponentSummary], list[str]] | None:
+    """Load the component summaries and docstrings cached on disk, if they are still valid."""
+    from holoviz_mcp.panel_mcp.models import ComponentSummary
 
-    global _COMPONENTS
-    if not _COMPONENTS:
-        packages_depending_on_panel = _list_packages_depending_on("panel")
+    path = _components_cache_path()
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _COMPONENTS_CACHE_VERSION or data.get("fingerprint") != fingerprint:
+            return None
+        if data["sources_fingerprint"] != _sources_fingerprint(data["sources"]):
+            return None
+        summaries = []
+        docstrings = []
+        for item in data["components"]:
+            docstrings.append(item.pop("docstring"))
+            summaries.append(ComponentSummary(**item))
+    except (json.JSONDecodeError, OSError, AttributeError, KeyError, TypeError, ValueError):
+        return None
+    return summaries, docstrings
+
+
+def _save_cached_components(fingerprint: str, summaries: list[ComponentSummary], docstrings: list[str], sources: list[str]) -> None:
+    """Save the component summaries and docstrings to disk for reuse by later processes.
+
+    ``sources`` are the directories whose Python sources must be unchanged for the cache to be reused.
+    """
+    path = _components_cache_path()
+    data = {
+        "version": _COMPONENTS_CACHE_VERSION,
+        "fingerprint": fingerprint,
+        "sources": sources,
+        "sources_fingerprint": _sources_fingerprint(sources),
+        "components": [{**component.model_dump(), "docstring": docstring} for component, docstring in zip(summaries, docstrings, strict=True)],
+    }
+    try:
+        _write_json(path, data)
+    except OSError as e:
+        logger.warning("Failed to save components cache %s: %s", path, e)
+
+
+def _discover_component_classes() -> list[type]:
+    """Import Panel and its extensions and return all public component classes.
+
+    The extensions are the packages depending on Panel plus the configured
+    ``panel.extra_packages``. Scanning the installed distributions for packages
+    depending on Panel is skipped if ``panel.discover_extensions`` is disabled.
+    """
+    from holoviz_mcp.config.loader import get_config
+    from holoviz_mcp.panel_mcp.data import get_component_classes
+
+    config = get_config().panel
+    if config.discover_extensions:
+        packages = list(_list_packages_depending_on("panel"))
+        logger.info("Discovered %d packages depending on Panel: %s", len(packages), packages)
+    else:
+        packages = []
+    packages.extend(package for package in config.extra_packages if package not in packages)
+
+    # Panel itself is already imported via panel_mcp.data, so the extensions can be imported concurrently
+    if packages:
+        with ThreadPoolExecutor(max_workers=min(8, len(packages))) as executor:
+            list(executor.map(_import_package, packages, [package in config.extra_packages for package in packages]))
+
+    return get_component_classes()
+
+
+def _get_component_class(index: int) -> type:
+    """Get the class of the component at the given position, importing it on first use."""
+    cls = _COMPONENT_CLASSES.get(index)
+    if cls is not None:
+        return cls
+
+    module_path = _SUMMARIES[index].module_path
+    module_name, _, class_name = module_path.rpartition(".")
+    try:
+        cls = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError):
+        # Not importable by its module path, e.g. if defined in a function. Fall back to discovery.
+        positions = {component.module_path: position for position, component in enumerate(_SUMMARIES)}
+        for discovered in _discover_component_classes():
+            position = positions.get(f"{discovered.__module__}.{discovered.__name__}")
+            if position is not None:
+                _COMPONENT_CLASSES[position] = discovered
+        if index not in _COMPONENT_CLASSES:
+            raise ValueError(f"Component '{module_path}' could not be imported. Was its package uninstalled?") from None
+        return _COMPONENT_CLASSES[index]
+
+    _COMPONENT_CLASSES[index] = cls
+    return cls
+
+
+def _get_component_details(index: int) -> ComponentDetails:
+    """Get the full details of the component at the given position, collecting them on first use."""
+    from holoviz_mcp.panel_mcp.data import collect_component_info
+
+    details = _DETAILS.get(index)
+    if details is None:
+        details = _DETAILS[index] = collect_component_info(_get_component_class(index))
+    return details
+
+
+def _import_package(package: str, configured: bool = False) -> None:
+    """Import a package, logging a warning if it cannot be imported.
 
-        logger.info("Discovered %d packages depending on Panel: %s", len(packages_depending_on_panel), packages_depending_on_panel)
+    Parameters
+    ----------
+    package : str
+        The name of the package to import.
+    configured : bool
+        Whether the package is listed in ``panel.extra_packages`` rather than discovered.
+    """
+    try:
+        __import__(package)
+    except ImportError as e:
+        if configured:
+            logger.warning("Failed to import %s configured in panel.extra_packages: %s", package, e)
+        else:
+            logger.warning("Discovered but failed to import %s: %s", package, e)
 
-        for package in packages_depending_on_panel:
-            try:
-                __import__(package)
-            except ImportError as e:
-                logger.warning("Discovered but failed to import %s: %s", package, e)
 
-        _COMPONENTS = _get_components_raw()
+def _build_indexes(summaries: list[ComponentSummary], docstrings: list[str]) -> None:
+    """Store the component summaries and build the search keys and lookup indexes.
 
-    return _COMPONENTS
+    Parameters
+    ----------
+    summaries : list[ComponentSummary]
+        The components to index. Indexes store positions into this list.
+    docstrings : list[str]
+        The docstrings of the components, aligned with ``summaries``.
+    """
+    global _PACKAGES
+
+    _SEARCH_KEYS[:] = [(summary.name.lower(), summary.module_path.lower(), docstring.lower()) for summary, docstring in zip(summaries, docstrings, strict=True)]
+    _COMPONENT_CLASSES.clear()
+    _DETAILS.clear()
+    _BY_NAME_LOWER.clear()
+    _BY_PACKAGE_LOWER.clear()
+    _BY_PACKAGE_AND_NAME_LOWER.clear()
+    for index, component in enumerate(summaries):
+        name_lower = component.name.lower()
+        package_lower = component.package.lower()
+        _BY_NAME_LOWER.setdefault(name_lower, []).append(index)
+        _BY_PACKAGE_LOWER.setdefault(package_lower, []).append(index)
+        _BY_PACKAGE_AND_NAME_LOWER.setdefault((package_lower, name_lower), []).append(index)
+    _MODULE_PATHS[:] = sorted((component.module_path, index) for index, component in enumerate(summaries))
+    _PACKAGES = tuple(sorted({component.package for component in summaries}))
+
+    # Cached results refer to the previous components
+    _list_components.cache_clear()
+    _search_components.cache_clear()
+
+    # Set last, as a non-empty _SUMMARIES signals that the indexes are ready
+    _SUMMARIES[:] = summaries
+
+
+def _module_path_candidates(module_path: str) -> list[int]:
+    """Return the indexes of all components whose module path starts with ``module_path``."""
+    start = bisect_left(_MODULE_PATHS, (module_path,))
+    candidates = []
+    for path, index in _MODULE_PATHS[start:]:
+        if not path.startswith(module_path):
+            break
+        candidates.append(index)
+    return sorted(candidates)
 
 
 def list_packages() -> list[str]:
@@ -102,7 +549,8 @@ def list_packages() -> list[str]:
     list[str]
         Sorted list of package names (e.g., ['panel', 'panel_material_ui']).
     """
-    return sorted(set(component.package for component in _get_all_components()))
+    _get_all_components()
+    return list(_PACKAGES)
 
 
 def list_components(
@@ -119,41 +567,56 @@ def list_components(
     module_path : str, optional
         Filter by module path prefix.
     package : str, optional
-        Filter by package name.
+        Filter by package name (case-insensitive).
 
     Returns
     -------
     list[ComponentSummary]
         Matching component summaries.
     """
-    result = []
-    for component in _get_all_components():
-        if name and component.name.lower() != name.lower():
-            continue
-        if package and component.package != package:
-            continue
-        if module_path and not component.module_path.startswith(module_path):
-            continue
-        result.append(component.to_base())
-    return result
+    return list(_list_components(name, module_path, package))
+
 
+@lru_cache(maxsize=256)
+def _list_components(name: str | None, module_path: str | None, package: str | None) -> tuple[ComponentSummary, ...]:
+    """Memoized list_components. Returns a tuple so the cached value cannot be mutated by callers."""
+    return tuple(_SUMMARIES[index] for index in _filter_indexes(name, module_path, package))
 
-def _filter_components(
+
+def _filter_indexes(
     name: str | None = None,
     module_path: str | None = None,
     package: str | None = None,
-) -> list[ComponentDetails]:
-    """Filter components by criteria. Internal helper."""
-    result = []
-    for component in _get_all_components():
-        if name and component.name.lower() != name.lower():
-            continue
-        if package and component.package != package:
-            continue
-        if module_path and not component.module_path.startswith(module_path):
-            continue
-        result.append(component)
-    return result
+) -> list[int]:
+    """Return the positions of the components matching the criteria. Internal helper.
+
+    Starts from the candidate set of the most selective filter given (name and
+    package, name, module path prefix, then package) and applies the remaining
+    filters to it.
+    Like search_components, the name and package filters are case-insensitive.
+    """
+    components = _get_all_components()
+    package_lower = package.lower() if package else None
+
+    candidates: Iterable[int]
+    if name and package_lower:
+        candidates = _BY_PACKAGE_AND_NAME_LOWER.get((package_lower, name.lower()), [])
+    elif name:
+        candidates = _BY_NAME_LOWER.get(name.lower(), [])
+    elif module_path:
+        candidates = _module_path_candidates(module_path)
+        if package_lower:
+            package_index_set = set(_BY_PACKAGE_LOWER.get(package_lower, []))
+            candidates = [index for index in candidates if index in package_index_set]
+        return list(candidates)
+    elif package_lower:
+        return list(_BY_PACKAGE_LOWER.get(package_lower, []))
+    else:
+        return list(range(len(components)))
+
+    if module_path:
+        candidates = [index for index in candidates if components[index].module_path.startswith(module_path)]
+    return list(candidates)
 
 
 def _find_similar_names(name: str) -> list[str]:
@@ -188,7 +651,7 @@ def get_component(
     module_path : str, optional
         Full module path.
     package : str, optional
-        Package name.
+        Package name (case-insensitive).
 
     Returns
     -------
@@ -200,9 +663,9 @@ def get_component(
     ValueError
         If no components match or multiple match.
     """
-    components = _filter_components(name, module_path, package)
+    indexes = _filter_indexes(name, module_path, package)
 
-    if not components:
+    if not indexes:
         # Check for partial matches to give a helpful "did you mean?" message
         suggestions = _find_similar_names(name) if name else []
         if suggestions:
@@ -216,11 +679,12 @@ def get_component(
         if package:
             parts.append(f"package='{package}'")
         raise ValueError(f"No components found matching {', '.join(parts) or '(no filters)'}. Please check your inputs.")
-    if len(components) > 1:
+    if len(indexes) > 1:
+        components = [_SUMMARIES[index] for index in indexes]
         options = ", ".join(f"'{c.package}.{c.name}'" for c in components)
         packages = " or ".join(f'package="{c.package}"' for c in components)
         raise ValueError(f"Multiple components found: {options}. Disambiguate by setting {packages}.")
-    return components[0]
+    return _get_component_details(indexes[0])
 
 
 def get_component_parameters(
@@ -237,7 +701,7 @@ def get_component_parameters(
     module_path : str, optional
         Full module path.
     package : str, optional
-        Package name.
+        Package name (case-insensitive).
 
     Returns
     -------
@@ -265,41 +729,64 @@ def search_components(
     query : str
         Search term.
     package : str, optional
-        Package name to filter by.
+        Package name to filter by (case-insensitive).
     limit : int
         Maximum results.
 
     Returns
     -------
     list[ComponentSummarySearchResult]
-        Matching components sorted by relevance score (descending).
+        Matching components sorted by relevance score (descending). If nothing
+        matches, components with names close to the query are returned instead.
     """
-    from holoviz_mcp.panel_mcp.models import ComponentSummarySearchResult as _SearchResult
-
-    query_lower = query.lower()
-
-    matches = []
-    for component in _get_all_components():
-        score = 0
-        if package and component.package.lower() != package.lower():
-            continue
-
-        if component.name.lower() == query_lower or component.module_path.lower() == query_lower:
-            score = 100
-        elif query_lower in component.name.lower():
-            score = 80
-        elif query_lower in component.module_path.lower():
-            score = 60
-        elif query_lower in component.docstring.lower():
-            score = 40
-        elif any(word in component.docstring.lower() for word in query_lower.split()):
-            score = 20
+    return list(_search_components(query, package, limit))
 
-        if score > 0:
-            matches.append(_SearchResult.from_component(component=component, relevance_score=score))
 
-    matches.sort(key=lambda x: (-x.relevance_score, len(x.name)))
-    if len(matches) > limit:
-        matches = matches[:limit]
+@lru_cache(maxsize=256)
+def _search_components(query: str, package: str | None, limit: int) -> tuple[ComponentSummarySearchResult, ...]:
+    """Memoized search_components. Returns a tuple so the cached value cannot be mutated by callers."""
+    from holoviz_mcp.panel_mcp.models import ComponentSummarySearchResult as _SearchResult
 
-    return matches
+    query_lower = query.lower()
+    # Match any of the query words in a single pass over the docstring
+    query_words = query_lower.split()
+    query_words_pattern = re.compile("|".join(re.escape(word) for word in query_words)) if query_words else None
+    components = _get_all_components()
+
+    # Only score the components of the requested package
+    candidates: Iterable[int] = _BY_PACKAGE_LOWER.get(package.lower(), []) if package else range(len(components))
+
+    # Collect (score, index) pairs and only build result models for the top `limit` matches
+    matches: list[tuple[int, int]] = []
+    if not query_lower:
+        # An empty query is contained in every name, so all candidates match the name tier
+        matches = [(80, index) for index in candidates]
+    else:
+        # The lowercased fields are precomputed, so no strings are allocated per component
+        for index in candidates:
+            name_lower, module_path_lower, docstring_lower = _SEARCH_KEYS[index]
+            score = 0
+            if name_lower == query_lower or module_path_lower == query_lower:
+                score = 100
+            elif query_lower in name_lower:
+                score = 80
+            elif query_lower in module_path_lower:
+                score = 60
+            elif query_lower in docstring_lower:
+                score = 40
+            elif query_words_pattern and query_words_pattern.search(docstring_lower):
+                score = 20
+
+            if score > 0:
+                matches.append((score, index))
+
+    # Fall back to names close to the query, to catch typos like 'buton'
+    if not matches and query_lower and limit > 0:
+        # Sorted, so that ties between equally close names are picked deterministically
+        names = sorted({_SEARCH_KEYS[index][0] for index in candidates})
+        close_names = set(difflib.get_close_matches(query_lower, names, n=limit, cutoff=0.8))
+        matches = [(10, index) for index in candidates if _SEARCH_KEYS[index][0] in close_names]
+
+    # Highest score first, then shortest name, then catalog order
+    top = heapq.nsmallest(limit, matches, key=lambda match: (-match[0], len(components[match[1]].name), match[1]))
+    return tuple(_SearchResult.from_component(component=components[index], relevance_score=score) for score, index in top)
@@ -4,13 +4,16 @@ This module manages the Panel server as a subprocess, including
 startup, health checks, and shutdown.
 """
 
+import logging
 import os
 import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import IO
 from typing import Optional
 
 import requests  # type: ignore[import-untyped]
@@ -193,6 +196,10 @@ class PanelServerManager:
                 text=True,
             )
 
+            # Drain the output as it arrives. Otherwise the server blocks once a pipe buffer is full.
+            self._forward_output(self.process.stdout, logging.DEBUG)
+            self._forward_output(self.process.stderr, logging.WARNING)
+
             # Wait for server to be ready
             if self._wait_for_health():
                 logger.info("Panel server started successfully")
@@ -207,6 +214,26 @@ class PanelServerManager:
             logger.exception(f"Error starting Panel server: {e}")
             return False
 
+    def _forward_output(self, stream: IO[str] | None, level: int) -> None:
+        """Forward the lines written to a stream of the Panel server to the logger.
+
+        Parameters
+        ----------
+        stream : IO[str] | None
+            The stdout or stderr pipe of the Panel server process
+        level : int
+            Logging level of the forwarded lines
+        """
+        if stream is None:
+            return
+
+        def forward() -> None:
+            with stream:
+                for line in stream:
+                    logger.log(level, "Panel server: %s", line.rstrip())
+
+        threading.Thread(target=forward, name=f"panel-server-output-{self.port}", daemon=True).start()
+
     def _wait_for_health(self, timeout: int = 30, interval: float = 1.0) -> bool:
         """Wait for Panel server to be healthy.
 
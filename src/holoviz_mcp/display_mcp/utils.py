@@ -59,7 +59,8 @@ def find_extensions(code: str, namespace: dict[str, Any] | None = None) -> list[
     if "vizzu" in code:
         extensions.append("vizzu")
 
-    return list(set(extensions))
+    # Deduplicate while keeping a deterministic order
+    return list(dict.fromkeys(extensions))
 
 
 class ExtensionError(Exception):
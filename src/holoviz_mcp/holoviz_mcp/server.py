@@ -6,6 +6,7 @@ and any user-defined/internal documentation you have configured.
 Use this server to search and access documentation for HoloViz libraries (Panel, hvPlot, etc.) and your custom projects.
 """
 
+import asyncio
 import atexit
 import dataclasses
 import json
@@ -40,6 +41,9 @@ _display_manager: Optional["PanelServerManager"] = None
 # Global display client instance (lazy-loaded)
 _display_client: Optional["DisplayClient"] = None
 
+# Serializes starting and restarting the display server, which runs in worker threads
+_DISPLAY_LOCK = asyncio.Lock()
+
 
 def _get_display_manager() -> Optional["PanelServerManager"]:
     """Get or create the Panel server manager (subprocess mode only)."""
@@ -517,20 +521,26 @@ async def display(
     if not config.display.enabled:
         return "Error: Display server is not enabled. Set display.enabled=true in config."
 
-    # Get client
-    client = _get_display_client()
-    if not client:
-        return "Error: Failed to initialize display client. Check logs for details."
-
-    # Check health with mode-aware logic
-    if not client.is_healthy():
-        if config.display.mode == "subprocess":
-            # Try to restart in subprocess mode
-            if ctx:
-                await ctx.info("Display server is not healthy, attempting restart...")
+    # Starting the server and the HTTP requests block, so run them in worker threads to keep
+    # the event loop serving other tool calls. The lock is held until the request completes, so a
+    # concurrent restart cannot close the client while it is in use
+    async with _DISPLAY_LOCK:
+        # Get client
+        client = await asyncio.to_thread(_get_display_client)
+        if not client:
+            return "Error: Failed to initialize display client. Check logs for details."
+
+        # Check health with mode-aware logic
+        if not await asyncio.to_thread(client.is_healthy):
+            if config.display.mode == "subprocess":
+                # Try to restart in subprocess mode
+                if ctx:
+                    await ctx.info("Display server is not healthy, attempting restart...")
+
+                manager = await asyncio.to_thread(_get_display_manager)
+                if not manager or not await asyncio.to_thread(manager.restart):
+                    return "Error: Display server is not healthy and failed to restart."
 
-            manager = _get_display_manager()
-            if manager and manager.restart():
                 # Recreate client with new base URL
                 global _display_client
                 if _display_client:
@@ -538,38 +548,37 @@ async def display(
                 _display_client = DisplayClient(base_url=manager.get_base_url())
                 client = _display_client
             else:
-                return "Error: Display server is not healthy and failed to restart."
-        else:
-            # Fail fast in remote mode
-            return "Error: Display server is not healthy. Check remote server status."
-
-    # Send request to Panel server
-    try:
-        response = client.create_snippet(
-            code=code,
-            name=name,
-            description=description,
-            method=method,
-        )
-        url = response.get("url", "")
+                # Fail fast in remote mode
+                return "Error: Display server is not healthy. Check remote server status."
 
-        # Check for errors in response
-        if error_message := response.get("error_message", None):
-            return f"""
+        # Send request to Panel server
+        try:
+            response = await asyncio.to_thread(
+                client.create_snippet,
+                code=code,
+                name=name,
+                description=description,
+                method=method,
+            )
+            url = response.get("url", "")
+
+            # Check for errors in response
+            if error_message := response.get("error_message", None):
+                return f"""
 Visualization created with errors. View here {url}
 
 {error_message}
 """
 
-        return f"Visualization created successfully!\n\nView here {url}"
+            return f"Visualization created successfully!\n\nView here {url}"
 
-    except Exception as e:
-        logger.exception(f"Error creating visualization: {e}")
+        except Exception as e:
+            logger.exception(f"Error creating visualization: {e}")
 
-        if ctx:
-            await ctx.error(f"Failed to create visualization: {e}")
+            if ctx:
+                await ctx.error(f"Failed to create visualization: {e}")
 
-        return f"Error: Failed to create visualization: {str(e)}"
+            return f"Error: Failed to create visualization: {str(e)}"
 
 
 @mcp.tool()
@@ -17,6 +17,7 @@ from textwrap import dedent
 from panel.viewable import Viewable
 
 from .models import ComponentDetails
+from .models import ComponentSummary
 from .models import ParameterInfo
 
 
@@ -45,13 +46,29 @@ def find_all_subclasses(cls: type) -> set[type]:
     return subclasses
 
 
-def collect_component_info(cls: type) -> ComponentDetails:
+def get_docstring(cls: type) -> str:
     """
-    Collect comprehensive information about a Panel component class.
+    Get the docstring of a Panel component class.
+
+    Parameters
+    ----------
+    cls : type
+        The Panel component class.
+
+    Returns
+    -------
+    str
+        The docstring, or an empty string if the class has none.
+    """
+    return cls.__doc__ if cls.__doc__ else ""
 
-    Extracts metadata including docstring, parameter information, method signatures,
-    and other relevant details from a Panel component class. Handles parameter
-    introspection safely, converting non-serializable values appropriately.
+
+def collect_component_summary(cls: type) -> ComponentSummary:
+    """
+    Collect summary information about a Panel component class.
+
+    This is much cheaper than collect_component_info as the parameters and
+    the signature of the class are not inspected.
 
     Parameters
     ----------
@@ -60,11 +77,10 @@ def collect_component_info(cls: type) -> ComponentDetails:
 
     Returns
     -------
-    ComponentDetails
-        A complete model containing all collected component information.
+    ComponentSummary
+        A summary model of the component.
     """
-    # Extract docstring
-    docstring = cls.__doc__ if cls.__doc__ else ""
+    docstring = get_docstring(cls)
 
     # Extract description (first sentence from docstring)
     description = ""
@@ -81,6 +97,34 @@ def collect_component_info(cls: type) -> ComponentDetails:
                 # Remove leading/trailing whitespace and normalize spaces
                 description = " ".join(description.split())
 
+    return ComponentSummary(
+        name=cls.__name__,
+        description=description,
+        package=cls.__module__.split(".")[0],
+        module_path=f"{cls.__module__}.{cls.__name__}",
+    )
+
+
+def collect_component_info(cls: type) -> ComponentDetails:
+    """
+    Collect comprehensive information about a Panel component class.
+
+    Extracts metadata including docstring, parameter information, method signatures,
+    and other relevant details from a Panel component class. Handles parameter
+    introspection safely, converting non-serializable values appropriately.
+
+    Parameters
+    ----------
+    cls : type
+        The Panel component class to analyze.
+
+    Returns
+    -------
+    ComponentDetails
+        A complete model containing all collected component information.
+    """
+    summary = collect_component_summary(cls)
+
     # Extract parameters information
     parameters = {}
     if hasattr(cls, "param"):
@@ -150,12 +194,12 @@ def collect_component_info(cls: type) -> ComponentDetails:
     # Read reference guide content
     # Create and return ComponentInfo model
     return ComponentDetails(
-        name=cls.__name__,
-        description=description,
-        package=cls.__module__.split(".")[0],
-        module_path=f"{cls.__module__}.{cls.__name__}",
+        name=summary.name,
+        description=summary.description,
+        package=summary.package,
+        module_path=summary.module_path,
         init_signature=init_signature,
-        docstring=docstring,
+        docstring=get_docstring(cls),
         parameters=parameters,
     )
 
@@ -191,13 +235,13 @@ def _is_public_component(cls: type) -> bool:
     return True
 
 
-def get_components(parent=Viewable) -> list[ComponentDetails]:
+def get_component_classes(parent=Viewable) -> list[type]:
     """
-    Get detailed information about all Panel component subclasses.
+    Get all public Panel component subclasses.
 
-    Discovers all subclasses of the specified parent class (typically Viewable),
-    filters out private classes, and collects comprehensive metadata for each.
-    Results are sorted alphabetically by module path for consistency.
+    Discovers all subclasses of the specified parent class (typically Viewable) and
+    filters out private, abstract, base and mixin classes. Results are sorted
+    alphabetically by module path for consistency.
 
     Parameters
     ----------
@@ -206,20 +250,36 @@ def get_components(parent=Viewable) -> list[ComponentDetails]:
 
     Returns
     -------
-    list[ComponentDetails]
-        List of detailed component information models, sorted by module path.
+    list[type]
+        List of component classes, sorted by module path.
     """
     all_subclasses = find_all_subclasses(parent)
 
     # Filter to concrete, user-facing components: exclude private, abstract, base, and mixin classes
     subclasses = [cls for cls in all_subclasses if not cls.__name__.startswith("_") and _is_public_component(cls)]
 
-    # Collect component information
-    component_data = [collect_component_info(cls) for cls in subclasses]
-
     # Sort by module_path for consistent ordering
-    component_data.sort(key=lambda x: x.module_path)
-    return component_data
+    subclasses.sort(key=lambda cls: f"{cls.__module__}.{cls.__name__}")
+    return subclasses
+
+
+def get_components(parent=Viewable) -> list[ComponentDetails]:
+    """
+    Get detailed information about all Panel component subclasses.
+
+    Collects comprehensive metadata for each class returned by get_component_classes.
+
+    Parameters
+    ----------
+    parent : type, optional
+        The parent class to search for subclasses. Defaults to panel.viewable.Viewable.
+
+    Returns
+    -------
+    list[ComponentDetails]
+        List of detailed component information models, sorted by module path.
+    """
+    return [collect_component_info(cls) for cls in get_component_classes(parent)]
 
 
 def save_components(data: list[ComponentDetails], filename: str) -> str:
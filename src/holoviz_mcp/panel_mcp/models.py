@@ -6,12 +6,14 @@ including parameter details, component summaries, and search results.
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 from typing import Optional
 
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import field_validator
 
 
 class ParameterInfo(BaseModel):
@@ -22,7 +24,8 @@ class ParameterInfo(BaseModel):
     documentation, and type-specific attributes like bounds or options.
     """
 
-    model_config = ConfigDict(extra="allow")  # Allow additional fields we don't know about
+    # All attributes collected by panel_mcp.data are declared below, so no extra fields are tracked
+    model_config = ConfigDict(frozen=True)
 
     # Common attributes that most parameters have
     type: str = Field(description="The type of the parameter, e.g., 'Parameter', 'Number', 'Selector'.")
@@ -49,11 +52,22 @@ class ComponentSummary(BaseModel):
     quick overviews.
     """
 
+    # Components are collected once and shared between calls, so they must not be mutated
+    model_config = ConfigDict(frozen=True)
+
     module_path: str = Field(description="Full module path of the component, e.g., 'panel.widgets.Button' or 'panel_material_ui.Button'.")
     name: str = Field(description="Name of the component, e.g., 'Button' or 'TextInput'.")
     package: str = Field(description="Package name of the component, e.g., 'panel' or 'panel_material_ui'.")
     description: str = Field(description="Short description of the component's purpose and functionality.")
 
+    @field_validator("module_path", "name", "package", mode="before")
+    @classmethod
+    def _intern(cls, value: Any) -> Any:
+        """Intern the values that repeat across many components, e.g. 'panel'."""
+        if isinstance(value, str):
+            return sys.intern(value)
+        return value
+
 
 class ComponentSummarySearchResult(ComponentSummary):
     """
@@ -67,13 +81,13 @@ class ComponentSummarySearchResult(ComponentSummary):
     relevance_score: int = Field(default=0, description="Relevance score for search results")
 
     @classmethod
-    def from_component(cls, component: ComponentDetails, relevance_score: int) -> ComponentSummarySearchResult:
+    def from_component(cls, component: ComponentSummary, relevance_score: int) -> ComponentSummarySearchResult:
         """
         Create a search result from a component and relevance score.
 
         Parameters
         ----------
-        component : ComponentDetails
+        component : ComponentSummary
             The component to create a search result from.
         relevance_score : int
             The relevance score (0-100) for this search result.
@@ -83,7 +97,8 @@ class ComponentSummarySearchResult(ComponentSummary):
         ComponentSummarySearchResult
             A search result summary of the component.
         """
-        return cls(
+        # The component is already validated, so skip validation on this hot path
+        return cls.model_construct(
             module_path=component.module_path, name=component.name, package=component.package, description=component.description, relevance_score=relevance_score
         )
 
@@ -116,7 +131,8 @@ class ComponentDetails(ComponentSummary):
         ComponentSummary
             A summary version of this component.
         """
-        return ComponentSummary(
+        # This component is already validated, so skip validation
+        return ComponentSummary.model_construct(
             module_path=self.module_path,
             name=self.name,
             package=self.package,
@@ -8,6 +8,7 @@ Use this server to access:
 - Panel Components: Detailed information about specific Panel components like widgets (input), panes (output) and layouts.
 """
 
+import asyncio
 import logging
 
 from fastmcp import Context
@@ -68,7 +69,8 @@ async def list_packages(ctx: Context) -> list[str]:
     >>> list_components(package="panel_material_ui")
     >>> search("button", package="panel")
     """
-    return _list_packages()
+    # Panel and its extensions are imported on first use, so run the core functions off the event loop
+    return await asyncio.to_thread(_list_packages)
 
 
 @mcp.tool(name="search")
@@ -112,7 +114,7 @@ async def search_components(ctx: Context, query: str, package: str | None = None
     >>> search_components("chart", limit=5)
     [ComponentSummarySearchResult(name="Bokeh", package="panel", ...)]
     """
-    return _search_components(query=query, package=package, limit=limit)
+    return await asyncio.to_thread(_search_components, query=query, package=package, limit=limit)
 
 
 @mcp.tool(name="list")
@@ -158,7 +160,7 @@ async def list_components(ctx: Context, name: str | None = None, module_path: st
     >>> list_components(name="Button")
     [ComponentSummary(name="Button", package="panel", ...), ComponentSummary(name="Button", package="panel_material_ui", ...)]
     """
-    return _list_components(name=name, module_path=module_path, package=package)
+    return await asyncio.to_thread(_list_components, name=name, module_path=module_path, package=package)
 
 
 @mcp.tool(name="get")
@@ -213,7 +215,7 @@ async def get_component(ctx: Context, name: str | None = None, module_path: str
     >>> get_component(module_path="panel.widgets.button.Button")
     ComponentDetails(name="Button", module_path="panel.widgets.button.Button", ...)
     """
-    return _get_component(name=name, module_path=module_path, package=package)
+    return await asyncio.to_thread(_get_component, name=name, module_path=module_path, package=package)
 
 
 @mcp.tool(name="params")
@@ -271,7 +273,7 @@ async def get_component_parameters(ctx: Context, name: str | None = None, module
     >>> get_component_parameters(module_path="panel.widgets.Slider")
     {"start": ParameterInfo(type="Number", default=0, bounds=(0, 100)), ...}
     """
-    return _get_component_parameters(name=name, module_path=module_path, package=package)
+    return await asyncio.to_thread(_get_component_parameters, name=name, module_path=module_path, package=package)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,10 @@ from holoviz_mcp.server import setup_composed_server
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
+# Substrings of the tool names in each category
+_DOCS_KEYWORDS = ("docs", "skill_get", "skill_list", "ref_get", "doc_get", "project_list", "update_index")
+_PANEL_KEYWORDS = ("pn_", "packages")
+
 
 async def extract_tools():
     """Extract available tools from the HoloViz MCP server and return as structured data."""
@@ -36,11 +40,9 @@ async def extract_tools():
                 tool_data["parameters"].append({"name": param_name, "type": param_type, "required": required, "description": desc})
 
         # Categorize tools
-        if any(x in tool_name for x in ["docs", "skill_get", "skill_list", "ref_get", "doc_get", "project_list", "update_index"]) or (
-            tool_name == "search" and "component" not in str(tool_info)
-        ):
+        if any(x in tool_name for x in _DOCS_KEYWORDS) or (tool_name == "search" and "component" not in (tool_data["description"] or "")):
             holoviz_tools.append(tool_data)
-        elif any(x in tool_name for x in ["pn_", "packages"]) or tool_name == "pn_search":
+        elif any(x in tool_name for x in _PANEL_KEYWORDS):
             panel_tools.append(tool_data)
         else:
             utility_tools.append(tool_data)
@@ -51,24 +53,21 @@ async def extract_tools():
 async def main():
     """Extract and print available tools from the HoloViz MCP server."""
     tools_data = await extract_tools()
-    logger.info("## 🛠️ Available Tools")
-    logger.info("")
+    # Collect the markdown and log it in one call instead of one call per line
+    lines = ["## 🛠️ Available Tools", ""]
 
     def print_tools(tools_list, category_name):
         if not tools_list:
             return
-        logger.info("<details>")
-        logger.info(f"<summary><b>{category_name}</b></summary>")
-        logger.info("")
+        lines.extend(["<details>", f"<summary><b>{category_name}</b></summary>", ""])
         for tool_data in tools_list:
-            logger.info(f"- **{tool_data['name']}**: {tool_data['description']}")
-            logger.info("")
-        logger.info("</details>")
-        logger.info("")
+            lines.extend([f"- **{tool_data['name']}**: {tool_data['description']}", ""])
+        lines.extend(["</details>", ""])
 
     print_tools(tools_data["panel_tools"], "Panel Components")
     print_tools(tools_data["holoviz_tools"], "Documentation")
     print_tools(tools_data["utility_tools"], "Utilities")
+    logger.info("\n".join(lines))
 
 
 if __name__ == "__main__":
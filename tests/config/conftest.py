@@ -1,10 +1,7 @@
 """Test fixtures for configuration tests."""
 
-import os
-import tempfile
 from pathlib import Path
 from typing import Any
-from typing import Generator
 
 import pytest
 import yaml
@@ -14,17 +11,20 @@ from holoviz_mcp.config import HoloVizMCPConfig
 
 
 @pytest.fixture
-def temp_config_dir() -> Generator[Path, None, None]:
+def temp_config_dir(tmp_path: Path) -> Path:
     """Create a temporary configuration directory."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+    # tmp_path is a subdirectory of a single per-session temporary directory
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    return config_dir
 
 
 @pytest.fixture
-def temp_repos_dir() -> Generator[Path, None, None]:
+def temp_repos_dir(tmp_path: Path) -> Path:
     """Create a temporary repositories directory."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+    repos_dir = tmp_path / "repos"
+    repos_dir.mkdir()
+    return repos_dir
 
 
 @pytest.fixture
@@ -130,8 +130,11 @@ def default_config_file(test_config: HoloVizMCPConfig) -> Path:
 
 
 @pytest.fixture
-def clean_environment():
-    """Clean environment variables before and after test."""
+def clean_environment(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Clean environment variables for the test.
+
+    Set variables with the returned monkeypatch, so they are restored after the test.
+    """
     env_vars = [
         "HOLOVIZ_MCP_USER_DIR",
         "HOLOVIZ_MCP_DEFAULT_DIR",
@@ -139,22 +142,6 @@ def clean_environment():
         "HOLOVIZ_MCP_LOG_LEVEL",
         "HOLOVIZ_MCP_SERVER_NAME",
     ]
-
-    # Save original values
-    original_values = {}
-    for var in env_vars:
-        original_values[var] = os.environ.get(var)
-
-    # Clear environment variables
     for var in env_vars:
-        if var in os.environ:
-            del os.environ[var]
-
-    yield
-
-    # Restore original values
-    for var, value in original_values.items():
-        if value is not None:
-            os.environ[var] = value
-        elif var in os.environ:
-            del os.environ[var]
+        monkeypatch.delenv(var, raising=False)
+    return monkeypatch
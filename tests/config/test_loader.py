@@ -1,6 +1,5 @@
 """Tests for configuration loader."""
 
-import os
 from pathlib import Path
 
 import pytest
@@ -63,10 +62,10 @@ class TestConfigLoader:
         assert "test-repo" in config.docs.repositories
         # No longer expect default repos like 'panel' unless present in YAML
 
-    def test_environment_variable_overrides(self, config_loader: ConfigLoader, clean_environment):
+    def test_environment_variable_overrides(self, config_loader: ConfigLoader, clean_environment: pytest.MonkeyPatch):
         """Test environment variable overrides."""
-        os.environ["HOLOVIZ_MCP_LOG_LEVEL"] = "ERROR"
-        os.environ["HOLOVIZ_MCP_SERVER_NAME"] = "env-server"
+        clean_environment.setenv("HOLOVIZ_MCP_LOG_LEVEL", "ERROR")
+        clean_environment.setenv("HOLOVIZ_MCP_SERVER_NAME", "env-server")
 
         config = config_loader.load_config()
 
@@ -111,6 +110,20 @@ class TestConfigLoader:
         with pytest.raises(ConfigurationError, match="Invalid configuration"):
             config_loader.load_config()
 
+    def test_user_panel_config(self, config_loader: ConfigLoader, test_config: HoloVizMCPConfig):
+        """Test that the panel section of the user configuration is loaded."""
+        config_file = test_config.config_file_path()
+        config_file.parent.mkdir(parents=True, exist_ok=True)
+
+        user_config = {"panel": {"extra_packages": ["my_extension"], "discover_extensions": False}}
+
+        with open(config_file, "w") as f:
+            yaml.dump(user_config, f)
+
+        config = config_loader.load_config()
+        assert config.panel.extra_packages == ["my_extension"]
+        assert config.panel.discover_extensions is False
+
     def test_config_caching(self, config_loader: ConfigLoader):
         """Test configuration caching."""
         config1 = config_loader.load_config()
@@ -11,6 +11,7 @@ from holoviz_mcp.config.models import DocsConfig
 from holoviz_mcp.config.models import FolderConfig
 from holoviz_mcp.config.models import GitRepository
 from holoviz_mcp.config.models import HoloVizMCPConfig
+from holoviz_mcp.config.models import PanelConfig
 from holoviz_mcp.config.models import PromptConfig
 from holoviz_mcp.config.models import ResourceConfig
 from holoviz_mcp.config.models import ServerConfig
@@ -116,6 +117,23 @@ class TestPromptConfig:
         assert config.search_paths == [Path("/custom/prompts")]
 
 
+class TestPanelConfig:
+    """Test PanelConfig model."""
+
+    def test_default_panel_config(self):
+        """Test default panel configuration."""
+        config = PanelConfig()
+        assert config.discover_extensions is True
+        assert config.extra_packages == []
+        assert config.cache is True
+
+    def test_panel_config_with_values(self):
+        """Test panel configuration with values."""
+        config = PanelConfig(discover_extensions=False, extra_packages=["panel_material_ui"])
+        assert config.discover_extensions is False
+        assert config.extra_packages == ["panel_material_ui"]
+
+
 class TestServerConfig:
     """Test ServerConfig model."""
 
@@ -161,6 +179,7 @@ class TestHoloVizMCPConfig:
         assert isinstance(config.docs, DocsConfig)
         assert isinstance(config.resources, ResourceConfig)
         assert isinstance(config.prompts, PromptConfig)
+        assert isinstance(config.panel, PanelConfig)
 
     def test_config_with_custom_values(self):
         """Test configuration with custom values."""
@@ -0,0 +1,15 @@
+"""Test fixtures for the core tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the disk caches of the Panel core out of the user's directory.
+
+    Otherwise tests could pass against components cached by an earlier version of the code.
+    """
+    from holoviz_mcp.core import pn
+
+    monkeypatch.setattr(pn, "_components_cache_path", lambda: tmp_path / "cache" / "components.json")
+    monkeypatch.setattr(pn, "_dependents_cache_path", lambda: tmp_path / "cache" / "packages_depending_on.json")
@@ -38,6 +38,18 @@ class TestListComponents:
         assert all(comp.name == "Button" for comp in result)
         assert len(result) > 0
 
+    def test_filter_by_module_path_prefix(self):
+        result = list_components(module_path="panel.widgets")
+        assert len(result) > 0
+        assert all(comp.module_path.startswith("panel.widgets") for comp in result)
+
+    def test_filter_by_name_and_package(self):
+        result = list_components(name="button", package="panel")
+        assert [comp.name for comp in result] == ["Button"]
+
+    def test_filter_by_package_is_case_insensitive(self):
+        assert list_components(package="PANEL") == list_components(package="panel")
+
     def test_component_summary_fields(self):
         result = list_components()
         comp = result[0]
@@ -117,11 +129,28 @@ class TestSearchComponents:
         result = search_components("widget", limit=3)
         assert len(result) <= 3
 
+    def test_search_falls_back_to_close_names(self):
+        result = search_components("buton", package="panel")
+        assert "Button" in [r.name for r in result]
+
+    def test_search_with_zero_limit(self):
+        assert search_components("buton", limit=0) == []
+
+    def test_search_empty_query_matches_all_names(self):
+        result = search_components("", package="panel", limit=3)
+        assert len(result) == 3
+        assert all(r.relevance_score == 80 for r in result)
+
     def test_search_no_results(self):
         result = search_components("xyznonexistent12345")
         assert isinstance(result, list)
         assert len(result) == 0
 
+    def test_repeated_search_returns_fresh_list(self):
+        first = search_components("button")
+        first.clear()
+        assert search_components("button")
+
     def test_search_secondary_sort_shorter_names_first(self):
         """Within the same relevance score, shorter component names should rank higher."""
         result = search_components("slider", package="panel")
@@ -165,3 +194,155 @@ class TestListComponentsExcludesInternals:
         expected = ["Button", "IntSlider", "Select", "TextInput", "Column", "Row", "Markdown"]
         for expected_name in expected:
             assert expected_name in names, f"Expected public component '{expected_name}' missing from list"
+
+
+class TestPackagesDependingOnCache:
+    def test_result_is_reused_from_disk(self, tmp_path, monkeypatch):
+        from holoviz_mcp.core import pn
+
+        pn._list_packages_depending_on.cache_clear()
+        try:
+            expected = pn._list_packages_depending_on("panel")
+            assert (tmp_path / "cache" / "packages_depending_on.json").exists()
+
+            def _fail(target_package):
+                raise AssertionError("distributions should not be rescanned")
+
+            monkeypatch.setattr(pn, "_scan_packages_depending_on", _fail)
+            pn._list_packages_depending_on.cache_clear()
+            assert pn._list_packages_depending_on("panel") == expected
+        finally:
+            pn._list_packages_depending_on.cache_clear()
+
+    def test_malformed_packages_are_rescanned(self, tmp_path, monkeypatch):
+        import json
+
+        from holoviz_mcp.core import pn
+
+        path = tmp_path / "cache" / "packages_depending_on.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"fingerprint": pn._environment_fingerprint(), "packages": ["panel"]}))
+        monkeypatch.setattr(pn, "_scan_packages_depending_on", lambda target_package: ["my-extension"])
+        pn._list_packages_depending_on.cache_clear()
+        try:
+            assert pn._list_packages_depending_on("panel") == ["my-extension"]
+            assert json.loads(path.read_text())["packages"] == {"panel": ["my-extension"]}
+        finally:
+            pn._list_packages_depending_on.cache_clear()
+
+
+class TestDiscoverComponentClasses:
+    def test_scan_is_skipped_if_discovery_is_disabled(self, monkeypatch):
+        from holoviz_mcp.config.loader import get_config
+        from holoviz_mcp.core import pn
+
+        def _fail(target_package):
+            raise AssertionError("distributions should not be scanned")
+
+        monkeypatch.setattr(get_config().panel, "discover_extensions", False)
+        monkeypatch.setattr(pn, "_list_packages_depending_on", _fail)
+        names = [f"{cls.__module__}.{cls.__name__}" for cls in pn._discover_component_classes()]
+        assert "panel.widgets.button.Button" in names
+
+
+class TestComponentDetailsAreCollectedOnDemand:
+    def test_details_are_reused(self):
+        first = get_component(name="Button", package="panel")
+        assert get_component(name="Button", package="panel") is first
+
+
+class TestReadMetadataHeaders:
+    def test_reads_name_and_requirements(self, tmp_path):
+        from holoviz_mcp.core.pn import _read_metadata_headers
+
+        metadata = tmp_path / "METADATA"
+        metadata.write_text(
+            "Metadata-Version: 2.3\nName: panel-example\nLicense: BSD\n        \n        Folded license text\n"
+            "Requires-Dist: panel>=1.0\nRequires-Dist: pytest; extra == 'test'\n\nRequires-Dist: not-a-header\n",
+            encoding="utf-8",
+        )
+        assert _read_metadata_headers(str(metadata)) == ("panel-example", ["panel>=1.0", "pytest; extra == 'test'"])
+
+
+def _reset_components():
+    """Forget the loaded components and the memoized results derived from them."""
+    from holoviz_mcp.core import pn
+
+    pn._SUMMARIES.clear()
+    pn._list_components.cache_clear()
+    pn._search_components.cache_clear()
+
+
+class TestComponentsCache:
+    def test_summaries_are_reused_from_disk(self, tmp_path, monkeypatch):
+        from holoviz_mcp.core import pn
+
+        _reset_components()
+        try:
+            expected = list_components(package="panel")
+            assert (tmp_path / "cache" / "components.json").exists()
+
+            def _fail():
+                raise AssertionError("components should not be rediscovered")
+
+            monkeypatch.setattr(pn, "_discover_component_classes", _fail)
+            _reset_components()
+            assert list_components(package="panel") == expected
+            assert get_component(name="Button", package="panel").parameters
+        finally:
+            _reset_components()
+
+    def test_changed_sources_are_rediscovered(self, tmp_path, monkeypatch):
+        import importlib
+        import sys
+
+        from holoviz_mcp.core import pn
+
+        package_dir = tmp_path / "src" / "my_extension"
+        package_dir.mkdir(parents=True)
+        (package_dir / "__init__.py").write_text("", encoding="utf-8")
+        panes = package_dir / "panes.py"
+        panes.write_text("import panel as pn\n\n\nclass Alpha(pn.pane.Markdown):\n    pass\n", encoding="utf-8")
+        monkeypatch.syspath_prepend(str(tmp_path / "src"))
+        monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+        def _discover():
+            # Import the current source, like a new process using an editable install would
+            sys.modules.pop("my_extension.panes", None)
+            module = importlib.import_module("my_extension.panes")
+            return [getattr(module, name) for name in ("Alpha", "Beta") if hasattr(module, name)]
+
+        monkeypatch.setattr(pn, "_discover_component_classes", _discover)
+        _reset_components()
+        try:
+            assert [component.name for component in list_components(package="my_extension")] == ["Alpha"]
+
+            with panes.open("a", encoding="utf-8") as f:
+                f.write("\n\nclass Beta(pn.pane.Markdown):\n    pass\n")
+            _reset_components()
+            assert sorted(component.name for component in list_components(package="my_extension")) == ["Alpha", "Beta"]
+        finally:
+            _reset_components()
+            sys.modules.pop("my_extension.panes", None)
+            sys.modules.pop("my_extension", None)
+
+    def test_cache_can_be_disabled(self, tmp_path, monkeypatch):
+        from holoviz_mcp.config.loader import get_config
+
+        monkeypatch.setattr(get_config().panel, "cache", False)
+        _reset_components()
+        try:
+            assert list_components(package="panel")
+            assert not (tmp_path / "cache" / "components.json").exists()
+        finally:
+            _reset_components()
+
+    def test_collection_code_is_part_of_the_key(self, tmp_path, monkeypatch):
+        from holoviz_mcp.core import pn
+
+        collection_module = tmp_path / "data.py"
+        collection_module.write_text("def _is_public_component(cls): return True\n", encoding="utf-8")
+        monkeypatch.setattr(pn, "_COLLECTION_MODULE_PATH", collection_module)
+        before = pn._components_fingerprint()
+        collection_module.write_text("def _is_public_component(cls): return False\n", encoding="utf-8")
+        assert pn._components_fingerprint() != before
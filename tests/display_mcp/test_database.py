@@ -1,8 +1,5 @@
 """Tests for display database module."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from holoviz_mcp.display_mcp.database import Snippet
@@ -13,16 +10,9 @@ class TestSnippetDatabase:
     """Tests for SnippetDatabase."""
 
     @pytest.fixture
-    def temp_db(self):
+    def temp_db(self, tmp_path):
         """Create a temporary database for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = Path(f.name)
-
-        db = SnippetDatabase(db_path)
-        yield db
-
-        # Cleanup
-        db_path.unlink(missing_ok=True)
+        return SnippetDatabase(tmp_path / "snippets.db")
 
     def test_create_snippet(self, temp_db):
         """Test creating a display snippet."""
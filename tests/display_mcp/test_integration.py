@@ -9,9 +9,7 @@ in CI. The core functionality (database, utils, UI pages) is fully tested.
 """
 
 import os
-import tempfile
 import time
-from pathlib import Path
 
 import pytest
 
@@ -24,24 +22,19 @@ from holoviz_mcp.display_mcp.manager import PanelServerManager
 class TestPanelServerIntegration:
     """Integration tests for Panel server."""
 
-    @pytest.fixture
-    def temp_db_path(self):
+    @pytest.fixture(scope="class")
+    def temp_db_path(self, tmp_path_factory):
         """Create a temporary database path."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = Path(f.name)
-
-        yield db_path
-
-        # Cleanup
-        db_path.unlink(missing_ok=True)
+        return tmp_path_factory.mktemp("display") / "snippets.db"
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def manager(self, temp_db_path):
-        """Create a Panel server manager for testing."""
-        # Use a different port to avoid conflicts
+        """Create a Panel server manager for testing, shared by the tests of the class."""
+        # Use a different port than the default display server, and one per pytest-xdist worker
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
         mgr = PanelServerManager(
             db_path=temp_db_path,
-            port=5006,  # Different port for testing
+            port=5006 + int(worker.removeprefix("gw")),
             host="127.0.0.1",
         )
 
@@ -169,13 +162,10 @@ arr.mean()
         # Verify initial health
         assert manager.is_healthy()
 
-        # Restart
+        # Restart, which waits until the server reports healthy again
         success = manager.restart()
         assert success
 
-        # Wait a moment for restart
-        time.sleep(2)
-
         # Verify healthy after restart
         assert manager.is_healthy()
 
@@ -188,4 +178,4 @@ arr.mean()
             assert os.getenv("JUPYTER_SERVER_PROXY_URL") in url
         else:
             assert "127.0.0.1" in url or "localhost" in url
-        assert "5006" in url  # Test port
+        assert str(manager.port) in url  # Test port
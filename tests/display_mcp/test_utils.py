@@ -36,6 +36,11 @@ class TestUtils:
         extensions = find_extensions(code)
         assert extensions.count("plotly") == 1
 
+    def test_find_extensions_order_is_deterministic(self):
+        """Test that extensions are returned in a stable order."""
+        code = "import vtk\nimport plotly\nimport altair"
+        assert find_extensions(code) == ["plotly", "vega", "vtk"]
+
     def test_find_requirements_basic(self):
         """Test finding package requirements."""
         code = "import pandas as pd\nimport numpy as np"